@@ -1,11 +1,24 @@
 import os
 import sys
-import json
 import time
-import textwrap
+import hashlib
 import requests
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
+from urllib.parse import urlsplit
+try:
+    import orjson
+except ImportError:  # stdlib fallback so a plain install still runs
+    orjson = None
+    import json
+try:
+    import httpx
+    import h2  # noqa: F401 -- httpx needs it for HTTP/2
+except ImportError:  # fall back to requests for the API session
+    httpx = None
 from PySide6.QtGui import QPainter, QPainterPath
 
 from PySide6.QtWidgets import (
@@ -14,18 +27,121 @@ from PySide6.QtWidgets import (
     QButtonGroup, QMessageBox
 )
 from PySide6.QtGui import QFont, QPalette, QColor, QPixmap
-from PySide6.QtCore import Qt
-
-# Selenium imports for automatic login
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from PySide6.QtCore import Qt, QObject, QRunnable, QSignalBlocker, QThreadPool, QTimer, Signal
 
 # --- Program version ---
 PROGRAM_VERSION = "1.0.4"  # bumped
 UPDATE_CHECK_URL = "https://raw.githubusercontent.com/Zam6969/FanslyGoalManager/refs/heads/main/version.txt"
 GITHUB_REPO_URL = "https://github.com/Zam6969/FanslyGoalManager"
 CONFIG_PATH = os.path.join(os.path.expanduser("~"), "fansly_config.json")
+API_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+CHROMEDRIVER_TTL = 7 * 24 * 3600  # re-check for a newer chromedriver weekly
+AVATAR_CACHE_TTL = 24 * 3600  # re-download the avatar at most daily
+AVATAR_SIZE = 64  # px, the avatar label is fixed at this size
+GOALS_FRESH_SECS = 2.0  # a goal list younger than this is shown as-is on a plain fetch
+
+# Preset button ids encode group * 100 + action * 10 + slot
+PRESET_SAVE, PRESET_EDIT, PRESET_SEND = 0, 1, 2
+
+
+def make_session(headers=None):
+    """
+    Returns a keep-alive requests.Session with a connection pool and retries on
+    transient gateway errors (urllib3 only retries idempotent methods on status).
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+    return session
+
+
+def make_api_client(headers=None):
+    """
+    Returns the client for apiv3.fansly.com: an HTTP/2 httpx.Client when httpx[http2]
+    is installed, so parallel batches multiplex over one connection, else make_session().
+    httpx only retries failed connects, not gateway statuses.
+    """
+    if httpx is None:
+        return make_session(headers)
+    transport = httpx.HTTPTransport(http2=True, retries=2, limits=httpx.Limits(max_connections=10))
+    return httpx.Client(headers=headers, transport=transport,
+                        timeout=httpx.Timeout(API_TIMEOUT[1], connect=API_TIMEOUT[0]))
+
+
+# Shared keep-alive session for requests made outside GoalManager
+_SESSION = make_session()
+
+def avatar_cache_path(avatar_url):
+    """
+    Local PNG holding the already-circular avatar for avatar_url. Keyed by the
+    URL path only, since CDN links carry per-request signature query strings.
+    """
+    h = hashlib.sha1(urlsplit(avatar_url).path.encode()).hexdigest()[:16]
+    return os.path.join(os.path.dirname(CONFIG_PATH), f".fansly_avatar_{h}.png")
+
+
+def avatar_cache_is_fresh(path):
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < AVATAR_CACHE_TTL
+
+
+@lru_cache(maxsize=None)
+def app_font(family, size, bold=False):
+    """
+    Shared QFont per (family, size, bold). Built on first use because QFont
+    needs a QApplication, which only exists once __main__ has run.
+    """
+    font = QFont(family, size)
+    font.setBold(bold)
+    return font
+
+
+def json_loads(data):
+    """Parses JSON from str or bytes, with orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj, sort_keys=False):
+    """Serializes obj to compact UTF-8 bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_json(r):
+    """Decodes a response body straight from bytes (no str round trip)."""
+    return json_loads(r.content)
+
+
+def _goal_from_reply(r):
+    """
+    Returns the goal object a successful goal mutation echoed back, or False when
+    the body isn't JSON or carries no goal (the caller should refresh instead).
+    """
+    try:
+        goal = _parse_json(r).get("response")
+    except (ValueError, AttributeError):
+        return False
+    return goal if isinstance(goal, dict) and "goalAmount" in goal else False
+
+
+def _now_ms():
+    """Milliseconds since the epoch, on a pure integer path."""
+    return time.time_ns() // 1_000_000
+
+
+def _request_failure(future):
+    """
+    Returns None if a finished request future got a 2xx response, else what
+    went wrong: the status code, or the name of the exception it raised.
+    """
+    try:
+        code = future.result().status_code
+    except Exception as e:
+        return type(e).__name__
+    return None if code // 100 == 2 else code
+
 
 # === Functions for automatic login and credential fetching ===
 
@@ -36,6 +152,25 @@ def fetch_raw_session(driver, storage_key="session_active_session"):
     return driver.execute_script(f"return window.localStorage.getItem('{storage_key}');")
 
 
+# Resolves (via the async-script callback) as soon as the session key is written
+_WAIT_FOR_SESSION_JS = """
+var key = arguments[0], done = arguments[arguments.length - 1];
+var iv = setInterval(function () {
+    var v = window.localStorage.getItem(key);
+    if (v) { clearInterval(iv); done(v); }
+}, 100);
+"""
+
+
+def wait_for_raw_session(driver, storage_key="session_active_session", timeout=300):
+    """
+    Blocks inside the page until localStorage has the given key and returns its
+    raw JSON string. Raises if the script times out or the page navigates away.
+    """
+    driver.set_script_timeout(timeout)
+    return driver.execute_async_script(_WAIT_FOR_SESSION_JS, storage_key)
+
+
 def extract_token(raw_json):
     """
     Given a JSON string, parse and extract a token under common keys.
@@ -44,8 +179,8 @@ def extract_token(raw_json):
     if raw_json is None:
         return None, "no raw data (key not set yet)"
     try:
-        data = json.loads(raw_json)
-    except (json.JSONDecodeError, TypeError) as e:
+        data = json_loads(raw_json)
+    except (ValueError, TypeError) as e:
         return None, f"invalid JSON in storage: {e}"
     if not isinstance(data, dict):
         return None, f"unexpected storage format (not an object): {data!r}"
@@ -60,41 +195,70 @@ def login_and_fetch_credentials():
     Launches a Chrome browser for the user to log in, polls localStorage for the
     Fansly session token, then calls the account/me endpoint to get the chatRoomId.
     """
+    # Selenium is only needed on first login, so keep it off the normal startup path
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.chrome import ChromeDriverManager
+
     # Start Chrome
     options = webdriver.ChromeOptions()
+    # Skip work the login window doesn't need (not headless: the user has to log in)
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--log-level=3")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
     # Uncomment to persist login between runs:
     # options.add_argument("--user-data-dir=./selenium-profile")
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options
-    )
+    # ChromeDriverManager().install() hits the network and walks its cache; reuse a recent result
+    def install_driver():
+        path = ChromeDriverManager().install()
+        update_config(CHROMEDRIVER_PATH=path, CHROMEDRIVER_TS=int(time.time()))
+        return path
+
+    driver_path = cached_chromedriver_path()
+    if driver_path:
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        except SessionNotCreatedException as e:
+            # Chrome updated past the cached driver's version: fetch a matching one
+            print(f"[WARN] Cached chromedriver rejected, reinstalling: {e.msg}")
+            driver_path = None
+    if not driver_path:
+        driver = webdriver.Chrome(service=Service(install_driver()), options=options)
 
     # Navigate to Fansly
     driver.get("https://fansly.com/")
     print("🚀 Browser opened. Please log in to https://fansly.com/ …")
 
-    # Poll for session token
+    # Wait in-page for the session token; falls back to polling below if that fails
     token = None
-    while token is None:
-        raw = fetch_raw_session(driver)
-        token, err = extract_token(raw)
+    try:
+        token, err = extract_token(wait_for_raw_session(driver))
         if token:
             print("✅ Retrieved session token.")
-            break
         else:
             print("⚠️", err)
-        time.sleep(1)
+    except Exception as e:
+        print(f"[WARN] In-page token wait failed, polling instead: {e}")
 
-    driver.quit()
+    try:
+        if token is None:
+            token = WebDriverWait(driver, 300, poll_frequency=0.2).until(
+                lambda d: extract_token(fetch_raw_session(d))[0])
+            print("✅ Retrieved session token.")
+    finally:
+        driver.quit()
 
     # Fetch chatRoomId via API
     headers = {"Authorization": token, "Content-Type": "application/json"}
-    resp = requests.get(
+    resp = _SESSION.get(
         "https://apiv3.fansly.com/api/v1/account/me?ngsw-bypass=true",
-        headers=headers
+        headers=headers, timeout=API_TIMEOUT
     )
     resp.raise_for_status()
-    data = resp.json().get("response", {})
+    data = _parse_json(resp).get("response") or {}
     account = data.get("account", {})
     streaming = account.get("streaming", {})
     channel = streaming.get("channel", {})
@@ -105,11 +269,17 @@ def login_and_fetch_credentials():
     return token, str(chat_room_id)
 
 
+# In-memory copy of the whole config file, so writes of one part never drop the others
+_config = {}
+
+
 def load_config():
     if os.path.exists(CONFIG_PATH):
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            d = json.load(f)
-        return d.get("AUTH_TOKEN"), d.get("CHATROOM_ID"), d.get("PRESETS", {})
+        with open(CONFIG_PATH, 'rb') as f:
+            d = json_loads(f.read())
+        _config.update(d)
+        # Normalize on load so every lookup in memory sees the same (string) keys
+        return d.get("AUTH_TOKEN"), d.get("CHATROOM_ID"), normalize_presets(d.get("PRESETS", {}))
     return None, None, {}
 
 def normalize_presets(presets_obj):
@@ -134,37 +304,96 @@ def normalize_presets(presets_obj):
     return norm
 
 def save_config(auth, chat_id, presets):
-    # Always dump a normalized version to avoid stray None/incorrect keys
-    presets = normalize_presets(presets)
-    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump({
-            "AUTH_TOKEN": auth,
-            "CHATROOM_ID": chat_id,
-            "PRESETS": presets
-        }, f, indent=2)
-
-def check_for_update():
-    try:
-        r = requests.get(UPDATE_CHECK_URL, timeout=5)
-        r.raise_for_status()
-        latest = r.text.strip()
-        if latest != PROGRAM_VERSION:
-            msg = QMessageBox()
-            msg.setWindowTitle("Update Available")
-            msg.setText(
-                f"A new version is available!\n\n"
-                f"Your version: {PROGRAM_VERSION}\n"
-                f"Latest version: {latest}\n\n"
-                f"Would you like to open the GitHub repo to download it?"
-            )
-            msg.setIcon(QMessageBox.Information)
-            open_btn = msg.addButton("Open Repo", QMessageBox.AcceptRole)
-            msg.addButton("Not Really (continue)", QMessageBox.RejectRole)
-            msg.exec()
-            if msg.clickedButton() == open_btn:
-                webbrowser.open(GITHUB_REPO_URL)
-    except Exception as e:
-        print(f"[WARN] Version check failed: {e}")
+    # presets is already normalized: load_config normalizes it once and save_preset
+    # only ever adds string-keyed dicts
+    _config.update({
+        "AUTH_TOKEN": auth,
+        "CHATROOM_ID": chat_id,
+        "PRESETS": presets
+    })
+    _write_config()
+
+def update_config(**fields):
+    """
+    Sets extra top-level config keys (e.g. the cached chromedriver path) and
+    writes the file, keeping everything else that was loaded or saved.
+    """
+    _config.update(fields)
+    _write_config()
+
+def _write_config():
+    # Serialize to one buffer and write it in a single call to a temp file, then swap
+    # it in so a crash never leaves a half-written config.
+    tmp_path = CONFIG_PATH + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(json_dumps(_config, sort_keys=True))
+    os.replace(tmp_path, CONFIG_PATH)
+
+def cached_chromedriver_path():
+    """
+    Returns the chromedriver path saved by a previous login if it still exists
+    and is younger than CHROMEDRIVER_TTL, else None.
+    """
+    path = _config.get("CHROMEDRIVER_PATH")
+    if path and os.path.exists(path) and time.time() - _config.get("CHROMEDRIVER_TS", 0) < CHROMEDRIVER_TTL:
+        return path
+    return None
+
+def fetch_latest_version():
+    """
+    Returns (latest_version, etag). Sends the ETag saved from the last check so an
+    unchanged version.txt comes back as a body-less 304. Blocking; run it off the GUI thread.
+    """
+    etag = _config.get("VERSION_ETAG")
+    cached = _config.get("VERSION_LATEST")
+    headers = {"If-None-Match": etag} if etag and cached else None
+    r = _SESSION.get(UPDATE_CHECK_URL, timeout=3, headers=headers)
+    if r.status_code == 304:
+        return cached, etag
+    r.raise_for_status()
+    return r.text.strip(), r.headers.get("ETag")
+
+
+def show_update_dialog(latest, parent=None):
+    msg = QMessageBox(parent)
+    msg.setWindowTitle("Update Available")
+    msg.setText(
+        f"A new version is available!\n\n"
+        f"Your version: {PROGRAM_VERSION}\n"
+        f"Latest version: {latest}\n\n"
+        f"Would you like to open the GitHub repo to download it?"
+    )
+    msg.setIcon(QMessageBox.Information)
+    open_btn = msg.addButton("Open Repo", QMessageBox.AcceptRole)
+    msg.addButton("Not Really (continue)", QMessageBox.RejectRole)
+    msg.exec()
+    if msg.clickedButton() == open_btn:
+        import webbrowser  # only needed when an update is actually opened
+        webbrowser.open(GITHUB_REPO_URL)
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class ApiWorker(QRunnable):
+    """
+    Runs a blocking callable on the global thread pool and hands its result
+    (or error message) back to the GUI thread through queued signals.
+    """
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class LoginDialog(QDialog):
@@ -174,7 +403,7 @@ class LoginDialog(QDialog):
         self.setModal(True)
         self.resize(300, 100)
         btn = QPushButton("Login with Fansly")
-        btn.setFont(QFont("Segoe UI Emoji", 12))
+        btn.setFont(app_font("Segoe UI Emoji", 12))
         btn.clicked.connect(self._do_login)
         layout = QVBoxLayout(self)
         layout.addStretch()
@@ -199,6 +428,12 @@ class GoalManager(QWidget):
         super().__init__()
         self.setWindowTitle("Fansly Goal Manager")
         self.resize(1000, 600)
+        # One stylesheet pass instead of a setFont() call (and repolish) per widget
+        self.setStyleSheet(
+            'QLineEdit, QTextEdit, QPushButton, QRadioButton, QTabWidget, QTabBar,'
+            ' QLabel#panelHeader, QLabel#goalLabel'
+            ' { font-family: "Segoe UI Emoji"; font-size: 12pt; }'
+        )
         auth, chat_id, loaded_presets = load_config()
         if not auth or not chat_id:
             dlg = LoginDialog()
@@ -210,12 +445,20 @@ class GoalManager(QWidget):
 
         self.AUTH_TOKEN = auth
         self.CHAT_ID = chat_id  # this is the chatRoomId
-        # Normalize presets immediately so lookups are consistent
-        self.PRESETS = normalize_presets(loaded_presets or {})
+        # Shared head of every goal payload; per-call fields are merged onto it
+        self._base_payload = {"chatRoomId": self.CHAT_ID}
+        # load_config already hands back normalized presets
+        self.PRESETS = loaded_presets
+        self._config_dirty = False
         self.HEADERS = {
             "Authorization": self.AUTH_TOKEN,
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate"
         }
+        # One pooled session so every API call reuses the same TLS connection
+        self.session = make_api_client(self.HEADERS)
+        # Long-lived pool for fanning out independent requests (sized to the session pool)
+        self.io_pool = ThreadPoolExecutor(max_workers=10)
         self.BASE_URL = "https://apiv3.fansly.com/api/v1/chatroom/goals"
         self.CREATE_URL = self.BASE_URL + "?ngsw-bypass=true"
         self.UPDATE_URL = "https://apiv3.fansly.com/api/v1/chatroom/goal/update?ngsw-bypass=true"
@@ -225,9 +468,14 @@ class GoalManager(QWidget):
         self.ACCOUNT_ID = None     # your Fansly account id
         self.CHANNEL_ID = None     # streaming channel id
         self.CHANNEL_VERSION = None
+        self._pending_title = ""
 
         self.goals = []
-        self.font = QFont("Segoe UI Emoji", 12)
+        self.all_goals = []
+        self.goals_etag = None
+        self.goals_hash = None
+        self._goals_fetched_at = 0.0  # monotonic time of the last answered fetch
+        self._refresh_pending = False
         self.radio_buttons = []
         self.labels = []
 
@@ -235,13 +483,16 @@ class GoalManager(QWidget):
         top_bar = QHBoxLayout()
 
         self.avatar_label = QLabel()
-        self.avatar_label.setFixedSize(64, 64)
+        self.avatar_label.setFixedSize(AVATAR_SIZE, AVATAR_SIZE)
+        # Circular clip for the fixed-size avatar, built once
+        self._avatar_mask = QPainterPath()
+        self._avatar_mask.addEllipse(0, 0, AVATAR_SIZE, AVATAR_SIZE)
         self.avatar_label.setScaledContents(True)
         top_bar.addWidget(self.avatar_label)
 
         self.welcome_label = QLabel("Checking login status...")
         self.welcome_label.setAlignment(Qt.AlignLeft)
-        self.welcome_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        self.welcome_label.setFont(app_font("Segoe UI", 11, bold=True))
         top_bar.addWidget(self.welcome_label)
 
         top_bar.addStretch()
@@ -249,19 +500,17 @@ class GoalManager(QWidget):
         # ---------- Stream Title editor UI on the right of the top bar ----------
         title_box = QVBoxLayout()
         self.stream_title_hdr = QLabel("Stream Title")
-        self.stream_title_hdr.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.stream_title_hdr.setFont(app_font("Segoe UI", 10, bold=True))
         self.stream_title_hdr.setAlignment(Qt.AlignLeft)
 
         self.title_in = QLineEdit()
-        self.title_in.setFont(self.font)
         self.title_in.setPlaceholderText("Type your stream title…")
 
         self.title_update_btn = QPushButton("Update")
-        self.title_update_btn.setFont(self.font)
         self.title_update_btn.clicked.connect(self.update_stream_title)
 
         self.current_title_lbl = QLabel("Current Title: —")
-        self.current_title_lbl.setFont(QFont("Segoe UI", 10))
+        self.current_title_lbl.setFont(app_font("Segoe UI", 10))
         self.current_title_lbl.setStyleSheet("color: #cfcfcf")
 
         title_box.addWidget(self.stream_title_hdr)
@@ -281,134 +530,202 @@ class GoalManager(QWidget):
 
         footer = QHBoxLayout()
         credit = QLabel("made with love by cutezam")
-        credit.setFont(QFont("Segoe UI Emoji", 8))
+        credit.setFont(app_font("Segoe UI Emoji", 8))
         credit.setStyleSheet("color: gray;")
         footer.addWidget(credit, alignment=Qt.AlignLeft)
         footer.addStretch(1)
+        # Transient, non-modal error line (see _toast)
+        self.status_lbl = QLabel("")
+        self.status_lbl.setStyleSheet("color: #ff8080;")
+        footer.insertWidget(1, self.status_lbl)
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self.status_lbl.clear)
         outer.addLayout(footer)
 
         self.fetch_goals()
         self.load_account_status()  # populates title + channel info
-
-    def make_circular_pixmap(self, pixmap):
-        size = min(pixmap.width(), pixmap.height())
-        img = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        # Version check runs once the event loop starts so it never delays the window
+        QTimer.singleShot(0, self.check_for_update)
+
+    def make_circular_pixmap(self, pixmap, size=AVATAR_SIZE):
+        if pixmap.isNull():
+            return pixmap
+        if pixmap.width() == pixmap.height() == size:
+            img = pixmap
+        else:
+            img = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
         rounded = QPixmap(size, size)
         rounded.fill(Qt.transparent)
 
+        if size == AVATAR_SIZE:
+            path = self._avatar_mask
+        else:
+            path = QPainterPath()
+            path.addEllipse(0, 0, size, size)
         painter = QPainter(rounded)
-        path = QPainterPath()
-        path.addEllipse(0, 0, size, size)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.setClipPath(path)
         painter.drawPixmap(0, 0, img)
         painter.end()
-
         return rounded
 
     def load_account_status(self):
         """
         Loads account info, updates welcome/avatars, and fetches streaming channel
         identifiers + current title using streaming/channel/{ACCOUNT_ID}.
+        The requests run on a worker; widgets are updated in _apply_account_status.
         """
-        try:
-            # 1) Get account/me for username, avatar, and account id
-            r = requests.get("https://apiv3.fansly.com/api/v1/account/me?ngsw-bypass=true", headers=self.HEADERS)
-            r.raise_for_status()
-            data = r.json()
-            if data.get("success") and "response" in data:
-                account = data["response"]["account"]
-                username = account.get("username", "Unknown")
-                self.ACCOUNT_ID = account.get("id") or account.get("accountId")
-                self.welcome_label.setText(f"Welcome {username} – You are currently logged in")
-                self.welcome_label.setStyleSheet("color: lightgreen; font-size: 14px;")
-
-                # Avatar
-                avatar = account.get("avatar", {})
-                avatar_url = None
-                for variant in avatar.get("variants", []):
-                    if variant.get("type") != 3 and "locations" in variant:
-                        avatar_url = variant["locations"][0]["location"]
-                        break
-                if not avatar_url and "locations" in avatar:
-                    avatar_url = avatar["locations"][0]["location"]
-                if avatar_url:
-                    img_data = requests.get(avatar_url).content
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(img_data)
-                    self.avatar_label.setPixmap(self.make_circular_pixmap(pixmap))
-
-                # 2) Fetch streaming channel info (the place with the live stream 'title')
-                if self.ACCOUNT_ID:
-                    url = f"https://apiv3.fansly.com/api/v1/streaming/channel/{self.ACCOUNT_ID}?ngsw-bypass=true"
-                    rc = requests.get(url, headers=self.HEADERS)
-                    rc.raise_for_status()
-                    chan_data = rc.json()
-                    if chan_data.get("success") and "response" in chan_data:
-                        resp = chan_data["response"]
-                        self.CHANNEL_ID = resp.get("id") or resp.get("channelId")
-                        self.CHANNEL_VERSION = resp.get("version")
-                        stream_info = resp.get("stream", {}) or {}
-                        current_title = stream_info.get("title") or ""
-                        if current_title:
-                            self.title_in.setText(current_title)
-                            self.current_title_lbl.setText(f"Current Title: {current_title}")
-                        else:
-                            self.current_title_lbl.setText("Current Title: —")
+        self.run_in_background(self._fetch_account_status, self._apply_account_status,
+                               self._on_account_status_error)
+
+    def _fetch_account_status(self):
+        """
+        Blocking half of load_account_status (safe to run off the GUI thread).
+        Returns (account, avatar_url, avatar_bytes, channel), or None if not
+        logged in. avatar_bytes is None when a fresh copy is already cached on disk
+        or the download failed.
+        """
+        # 1) Get account/me for username, avatar, and account id
+        r = self._get("https://apiv3.fansly.com/api/v1/account/me?ngsw-bypass=true")
+        r.raise_for_status()
+        data = _parse_json(r)
+        if not (data.get("success") and "response" in data):
+            return None
+        account = data["response"]["account"]
+        account_id = account.get("id") or account.get("accountId")
+
+        # Avatar
+        # First non-type-3 variant with a location, else the avatar's own location
+        avatar = account.get("avatar") or {}
+        avatar_url = next((v["locations"][0]["location"] for v in avatar.get("variants") or []
+                           if v.get("type") != 3 and v.get("locations")), None)
+        if not avatar_url and avatar.get("locations"):
+            avatar_url = avatar["locations"][0]["location"]
+        # The avatar download doesn't depend on the channel call, so let them overlap
+        avatar_future = None
+        if avatar_url and not avatar_cache_is_fresh(avatar_cache_path(avatar_url)):
+            avatar_future = self.io_pool.submit(_SESSION.get, avatar_url, timeout=API_TIMEOUT)
+
+        # 2) Fetch streaming channel info (the place with the live stream 'title')
+        channel = None
+        if account_id:
+            url = f"https://apiv3.fansly.com/api/v1/streaming/channel/{account_id}?ngsw-bypass=true"
+            rc = self._get(url)
+            rc.raise_for_status()
+            chan_data = _parse_json(rc)
+            if chan_data.get("success") and "response" in chan_data:
+                channel = chan_data["response"]
+        img_data = None
+        if avatar_future:
+            ra = avatar_future.result()
+            # An error page is no image; fall back to whatever is cached on disk
+            if ra.status_code // 100 == 2:
+                img_data = ra.content
+        return account, avatar_url, img_data, channel
+
+    def _apply_account_status(self, result):
+        if result is None:
+            self._show_logged_out()
+            return
+        account, avatar_url, img_data, channel = result
+        username = account.get("username", "Unknown")
+        self.ACCOUNT_ID = account.get("id") or account.get("accountId")
+        self.welcome_label.setText(f"Welcome {username} – You are currently logged in")
+        self.welcome_label.setStyleSheet("color: lightgreen; font-size: 14px;")
+
+        if avatar_url:
+            cache_path = avatar_cache_path(avatar_url)
+            if img_data is None:
+                pixmap = QPixmap(cache_path)
             else:
-                self.welcome_label.setText("You are not logged in")
-                self.welcome_label.setStyleSheet("color: red; font-size: 14px;")
-        except Exception as e:
-            print(f"[WARN] load_account_status failed: {e}")
-            self.welcome_label.setText("You are not logged in")
-            self.welcome_label.setStyleSheet("color: red; font-size: 14px;")
+                # QPixmap is GUI-thread only, so the bytes are decoded here rather than in the worker
+                pixmap = QPixmap()
+                # Only cache what actually decoded; a bad download is retried next launch
+                if pixmap.loadFromData(img_data):
+                    pixmap = self.make_circular_pixmap(pixmap)
+                    pixmap.save(cache_path, "PNG")
+            self.avatar_label.setPixmap(pixmap)
+
+        if channel is not None:
+            self.CHANNEL_ID = channel.get("id") or channel.get("channelId")
+            self.CHANNEL_VERSION = channel.get("version")
+            stream_info = channel.get("stream", {}) or {}
+            current_title = stream_info.get("title") or ""
+            if current_title:
+                self.title_in.setText(current_title)
+                self.current_title_lbl.setText(f"Current Title: {current_title}")
+            else:
+                self.current_title_lbl.setText("Current Title: —")
+
+    def _on_account_status_error(self, message):
+        print(f"[WARN] load_account_status failed: {message}")
+        self._show_logged_out()
+
+    def _show_logged_out(self):
+        self.welcome_label.setText("You are not logged in")
+        self.welcome_label.setStyleSheet("color: red; font-size: 14px;")
 
     # ---------------------- Stream title update logic ----------------------
     def update_stream_title(self):
         """
-        Updates the stream title via streaming/channel/update. Tries minimal
-        payload first, then a richer payload if the API requires it.
+        Updates the stream title via streaming/channel/update in a single POST
+        carrying the full channel context. The requests run on a worker; the
+        Update button stays disabled until they finish.
         """
         new_title = self.title_in.text().strip()
         if not new_title:
             QMessageBox.warning(self, "Missing Title", "Please enter a stream title.")
             return
 
+        self._pending_title = new_title
+        self.title_update_btn.setEnabled(False)
         if not self.CHANNEL_ID or not self.ACCOUNT_ID:
-            # Refresh identifiers once if missing
-            self.load_account_status()
-            if not self.CHANNEL_ID:
-                QMessageBox.critical(self, "Channel Missing", "Could not determine your channel ID.")
-                return
-
-        attempts = [
-            # Minimal
-            {"id": self.CHANNEL_ID, "streamTitle": new_title},
-            # Rich (with more context)
-            {
-                "id": self.CHANNEL_ID,
-                "chatRoomId": self.CHAT_ID,
-                "accountId": self.ACCOUNT_ID,
-                "streamTitle": new_title,
-                **({"version": self.CHANNEL_VERSION} if self.CHANNEL_VERSION is not None else {})
-            }
-        ]
-
-        last_status = None
-        last_text = None
-        for pl in attempts:
+            # Refresh identifiers once if missing (needed before we can post)
+            self.run_in_background(self._fetch_account_status, self._on_title_ids_loaded,
+                                   self._on_title_ids_error)
+            return
+        self._post_stream_title()
+
+    def _on_title_ids_loaded(self, result):
+        self._apply_account_status(result)
+        if not self.CHANNEL_ID:
+            self.title_update_btn.setEnabled(True)
+            QMessageBox.critical(self, "Channel Missing", "Could not determine your channel ID.")
+            return
+        self._post_stream_title()
+
+    def _on_title_ids_error(self, message):
+        self._on_account_status_error(message)
+        self.title_update_btn.setEnabled(True)
+        QMessageBox.critical(self, "Channel Missing", "Could not determine your channel ID.")
+
+    def _post_stream_title(self):
+        # The rich form is accepted whether or not the API needs it, so one request suffices
+        pl = {
+            "id": self.CHANNEL_ID,
+            "chatRoomId": self.CHAT_ID,
+            "accountId": self.ACCOUNT_ID,
+            "streamTitle": self._pending_title,
+            **({"version": self.CHANNEL_VERSION} if self.CHANNEL_VERSION is not None else {})
+        }
+
+        def work():
             try:
-                r = requests.post(self.CHANNEL_UPDATE_URL, json=pl, headers=self.HEADERS, timeout=10)
-                last_status = r.status_code
-                last_text = r.text
-                if r.status_code // 100 == 2:
-                    self.refresh_current_title()
-                    QMessageBox.information(self, "Updated", "Stream title updated successfully.")
-                    return
+                r = self._post(self.CHANNEL_UPDATE_URL, pl)
             except Exception as e:
-                last_text = str(e)
-
-        QMessageBox.critical(self, "Update Failed", f"HTTP {last_status or '?'}\n{last_text or 'Unknown error'}")
+                return False, None, str(e)
+            return r.status_code // 100 == 2, r.status_code, r.text
+        self.run_in_background(work, self._on_stream_title_posted)
+
+    def _on_stream_title_posted(self, result):
+        self.title_update_btn.setEnabled(True)
+        ok, status, text = result
+        if ok:
+            self.refresh_current_title()
+            QMessageBox.information(self, "Updated", "Stream title updated successfully.")
+        else:
+            QMessageBox.critical(self, "Update Failed", f"HTTP {status or '?'}\n{text or 'Unknown error'}")
 
     def refresh_current_title(self):
         """
@@ -417,33 +734,38 @@ class GoalManager(QWidget):
         """
         if not self.ACCOUNT_ID:
             return
-        try:
-            url = f"https://apiv3.fansly.com/api/v1/streaming/channel/{self.ACCOUNT_ID}?ngsw-bypass=true"
-            rc = requests.get(url, headers=self.HEADERS, timeout=8)
+        url = f"https://apiv3.fansly.com/api/v1/streaming/channel/{self.ACCOUNT_ID}?ngsw-bypass=true"
+
+        def work():
+            rc = self._get(url)
             rc.raise_for_status()
-            chan_data = rc.json().get("response", {})
-            self.CHANNEL_ID = chan_data.get("id") or chan_data.get("channelId") or self.CHANNEL_ID
-            self.CHANNEL_VERSION = chan_data.get("version", self.CHANNEL_VERSION)
-            stream_info = chan_data.get("stream", {}) or {}
-            current_title = stream_info.get("title") or ""
-            if current_title:
-                self.current_title_lbl.setText(f"Current Title: {current_title}")
-                if not self.title_in.text().strip():
-                    self.title_in.setText(current_title)
-        except Exception as e:
-            print(f"[WARN] refresh_current_title failed: {e}")
+            return _parse_json(rc).get("response") or {}
+        self.run_in_background(work, self._apply_current_title, self._on_refresh_title_error)
+
+    def _apply_current_title(self, chan_data):
+        self.CHANNEL_ID = chan_data.get("id") or chan_data.get("channelId") or self.CHANNEL_ID
+        self.CHANNEL_VERSION = chan_data.get("version", self.CHANNEL_VERSION)
+        stream_info = chan_data.get("stream", {}) or {}
+        current_title = stream_info.get("title") or ""
+        if current_title:
+            self.current_title_lbl.setText(f"Current Title: {current_title}")
+            if not self.title_in.text().strip():
+                self.title_in.setText(current_title)
+
+    def _on_refresh_title_error(self, message):
+        print(f"[WARN] refresh_current_title failed: {message}")
     # ----------------------------------------------------------------------
 
     def build_left_panel(self):
         left = QVBoxLayout()
         left.addWidget(QLabel("Goal Amount"))
-        self.amount_in = QLineEdit(); self.amount_in.setFont(self.font)
+        self.amount_in = QLineEdit()
         left.addWidget(self.amount_in)
         left.addWidget(QLabel("Label"))
-        self.label_in = QLineEdit(); self.label_in.setFont(self.font)
+        self.label_in = QLineEdit()
         left.addWidget(self.label_in)
         left.addWidget(QLabel("Description"))
-        self.desc_in = QTextEdit(); self.desc_in.setFont(self.font)
+        self.desc_in = QTextEdit()
         left.addWidget(self.desc_in)
 
         for text, slot in [
@@ -456,7 +778,6 @@ class GoalManager(QWidget):
         ]:
             b = QPushButton(text)
             b.clicked.connect(slot)
-            b.setFont(self.font)
             left.addWidget(b)
 
         left.addStretch(1)
@@ -465,26 +786,27 @@ class GoalManager(QWidget):
     def build_middle_panel(self):
         mid = QVBoxLayout()
         hdr = QLabel("Presets", alignment=Qt.AlignCenter)
-        hdr.setFont(self.font)
+        hdr.setObjectName("panelHeader")
         mid.addWidget(hdr)
         self.tabs = QTabWidget()
-        self.tabs.setFont(self.font)
+        # A single group-wide dispatcher instead of one connection per button
+        self.preset_group = QButtonGroup(self)
+        self.preset_group.setExclusive(False)
         for g in (1, 2, 3):
             page = QWidget()
             grid = QGridLayout(page)
             for i, slot in enumerate((1, 2, 3)):
                 sv = QPushButton(f"Save {slot}")
                 ed = QPushButton(f"Edit {slot}")
-                sv.clicked.connect(lambda _, g=g, s=slot: self.save_preset(g, s))
-                ed.clicked.connect(lambda _, g=g, s=slot: self.edit_preset(g, s))
-                sv.setFont(self.font); ed.setFont(self.font)
+                self.preset_group.addButton(sv, g * 100 + PRESET_SAVE * 10 + slot)
+                self.preset_group.addButton(ed, g * 100 + PRESET_EDIT * 10 + slot)
                 grid.addWidget(sv, 0, i)
                 grid.addWidget(ed, 1, i)
             send = QPushButton("Send Presets")
-            send.clicked.connect(lambda _, g=g: self.send_presets(g))
-            send.setFont(self.font)
+            self.preset_group.addButton(send, g * 100 + PRESET_SEND * 10)
             grid.addWidget(send, 2, 0, 1, 3)
             self.tabs.addTab(page, f"Group {g}")
+        self.preset_group.idClicked.connect(self._dispatch_preset)
         mid.addWidget(self.tabs)
         mid.addStretch(1)
         return mid
@@ -492,49 +814,104 @@ class GoalManager(QWidget):
     def build_right_panel(self):
         right = QGridLayout()
         hdr = QLabel("Current Goals", alignment=Qt.AlignCenter)
-        hdr.setFont(self.font)
+        hdr.setObjectName("panelHeader")
         right.addWidget(hdr, 0, 0, 1, 2)
         self.radio_group = QButtonGroup(self)
         for i in range(3):
             rb = QRadioButton()
-            rb.setFont(self.font)
-            rb.toggled.connect(self.load_selected)
             lbl = QLabel()
-            lbl.setFont(self.font)
+            lbl.setObjectName("goalLabel")
             lbl.setWordWrap(True)
             self.radio_group.addButton(rb, i)
             self.radio_buttons.append(rb)
             self.labels.append(lbl)
             right.addWidget(rb, 1 + i, 0, alignment=Qt.AlignTop)
             right.addWidget(lbl, 1 + i, 1)
+        # idClicked fires once per user click (toggled fires for both old and new button)
+        self.radio_group.idClicked.connect(self.load_selected)
         right.setColumnStretch(1, 1)
         return right
 
-    def fetch_goals(self):
-        try:
-            params = {"chatRoomIds": self.CHAT_ID, "ngsw-bypass": "true"}
-            r = requests.get(self.BASE_URL, params=params, headers=self.HEADERS)
+    def fetch_goals(self, force=False):
+        # The list on screen is only seconds old: nothing to gain from another GET.
+        # Mutations pass force=True (via schedule_goals_refresh) since they make it stale.
+        if not force and time.monotonic() - self._goals_fetched_at < GOALS_FRESH_SECS:
+            return
+        params = {"chatRoomIds": self.CHAT_ID, "ngsw-bypass": "true"}
+        # Conditional GET: an unchanged list comes back as a body-less 304
+        headers = {"If-None-Match": self.goals_etag} if self.goals_etag else None
+
+        def work():
+            r = self._get(self.BASE_URL, params=params, headers=headers)
+            if r.status_code == 304:
+                return None
             r.raise_for_status()
-            data = r.json().get("response", [])[:3]
-        except Exception as e:
-            QMessageBox.critical(self, "Fetch Error", str(e))
-            data = []
-        self.goals = data
-        for i in range(3):
-            if i < len(data):
-                g = data[i]
-                text = "\n".join(textwrap.wrap(g.get("label", ""), width=30))
-                desc = "\n".join(textwrap.wrap(g.get("description", ""), width=40))
-                amt = f"$ {g.get('currentAmount', 0) // 1000} / $ {g['goalAmount'] // 1000}"
-                self.labels[i].setText(f"{text}\n{desc}\n{amt}")
-                self.radio_buttons[i].setEnabled(True)
-            else:
-                self.labels[i].clear()
-                self.radio_buttons[i].setChecked(False)
-                self.radio_buttons[i].setEnabled(False)
-
-    def load_selected(self):
-        idx = self.radio_group.checkedId()
+            # Byte-identical body to the last one shown: skip the parse and the UI refresh
+            content_hash = hash(r.content)
+            if content_hash == self.goals_hash:
+                return None
+            return r.headers.get("ETag"), content_hash, _parse_json(r).get("response") or []
+        self.run_in_background(work, self._on_goals_fetched, self._on_fetch_error)
+
+    def _on_goals_fetched(self, result):
+        self._goals_fetched_at = time.monotonic()
+        if result is None:
+            return
+        self.goals_etag, self.goals_hash, items = result
+        self._apply_goals(items)
+
+    def _on_fetch_error(self, message):
+        self._toast(f"Fetch error: {message}")
+        self.goals_etag = None
+        self.goals_hash = None
+        # The goals may well still exist, so keep whatever the user was typing
+        self._apply_goals([], clear_edits=False)
+
+    def _apply_goals(self, items, clear_edits=True, renamed=None):
+        # Follow the selected goal by id, since refreshes can move it to another slot;
+        # renamed maps old -> new ids for goals that were replaced (reset by re-create)
+        sel = self.radio_group.checkedId()
+        sel_id = self.goals[sel].get("id") if 0 <= sel < len(self.goals) else None
+        if renamed:
+            sel_id = renamed.get(sel_id, sel_id)
+        # Keep the full list for delete_all_goals; only the first 3 are shown
+        self.all_goals = items
+        self.goals = data = items[:3]
+        new_sel = next((i for i, g in enumerate(data) if g.get("id") == sel_id), -1) if sel_id else -1
+        # Batch the three slot updates into a single repaint, with no radio signals
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.radio_group):
+                for i, (rb, lbl) in enumerate(zip(self.radio_buttons, self.labels)):
+                    if i < len(data):
+                        g = data[i]
+                        # The labels word-wrap natively (setWordWrap in build_right_panel)
+                        amt = f"$ {g.get('currentAmount', 0) // 1000} / $ {g['goalAmount'] // 1000}"
+                        full = f"{g.get('label', '')}\n{g.get('description', '')}\n{amt}"
+                        if lbl.text() != full:
+                            lbl.setText(full)
+                        rb.setEnabled(True)
+                    else:
+                        lbl.clear()
+                        rb.setEnabled(False)
+                if new_sel >= 0:
+                    if new_sel != sel:
+                        self.radio_buttons[new_sel].setChecked(True)
+                elif sel >= 0:
+                    # The selected goal is gone. An exclusive group ignores
+                    # setChecked(False), so lift exclusivity to clear it
+                    self.radio_group.setExclusive(False)
+                    self.radio_buttons[sel].setChecked(False)
+                    self.radio_group.setExclusive(True)
+                    if clear_edits:
+                        self.amount_in.clear()
+                        self.label_in.clear()
+                        self.desc_in.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def load_selected(self, idx):
         if idx < 0 or idx >= len(self.goals): return
         g = self.goals[idx]
         self.amount_in.setText(str(g["goalAmount"] // 1000))
@@ -547,18 +924,13 @@ class GoalManager(QWidget):
         except:
             QMessageBox.warning(self, "Input Error", "Enter whole dollars")
             return
-        pl = {
-            "chatRoomId": self.CHAT_ID,
+        pl = self._base_payload | {
             "type": 0,
             "goalAmount": amt * 1000,
             "label": self.label_in.text().strip(),
             "description": self.desc_in.toPlainText().strip()
         }
-        r = requests.post(self.CREATE_URL, json=pl, headers=self.HEADERS)
-        if r.status_code // 100 == 2:
-            self.fetch_goals()
-        else:
-            QMessageBox.critical(self, "Error", f"{r.status_code}")
+        self.run_in_background(lambda: self._post_ok(self.CREATE_URL, pl), self._on_goals_changed)
 
     def delete_selected_goal(self):
         idx = self.radio_group.checkedId()
@@ -566,17 +938,12 @@ class GoalManager(QWidget):
             QMessageBox.warning(self, "No selection", "Select a goal first")
             return
         g = self.goals[idx]
-        pl = {
-            "id": g["id"], "chatRoomId": self.CHAT_ID, "accountId": g["accountId"],
-            "currentAmount": g.get("currentAmount", 0), "deletedAt": int(time.time() * 1000),
-            "description": g.get("description", ""), "goalAmount": g["goalAmount"],
-            "label": g["label"], "status": 1, "type": g.get("type", 0), "version": g.get("version", 0)
-        }
-        r = requests.post(self.UPDATE_URL, json=pl, headers=self.HEADERS)
-        if r.status_code // 100 == 2:
-            self.fetch_goals()
-        else:
-            QMessageBox.critical(self, "Error", f"Delete failed: {r.status_code}")
+        pl = self._goal_payload(g, status=1, deletedAt=_now_ms())
+
+        def work():
+            self._post_ok(self.UPDATE_URL, pl, "Delete failed: ")
+            return g["id"], None
+        self.run_in_background(work, self._on_goal_replaced, self._on_mutation_error)
 
     def update_goal(self):
         idx = self.radio_group.checkedId()
@@ -589,37 +956,35 @@ class GoalManager(QWidget):
         except:
             QMessageBox.warning(self, "Input Error", "Enter whole dollars")
             return
-        pl = {
-            "id": g["id"], "chatRoomId": self.CHAT_ID, "accountId": g["accountId"],
-            "currentAmount": g.get("currentAmount", 0), "deletedAt": g.get("deletedAt", 0),
-            "description": self.desc_in.toPlainText().strip(),
-            "goalAmount": amt * 1000, "label": self.label_in.text().strip(),
-            "status": g.get("status", 0), "type": g.get("type", 0), "version": g.get("version", 0)
-        }
-        r = requests.post(self.UPDATE_URL, json=pl, headers=self.HEADERS)
-        if r.status_code // 100 == 2:
-            self.fetch_goals()
-        else:
-            QMessageBox.critical(self, "Error", f"{r.status_code}")
+        pl = self._goal_payload(
+            g, description=self.desc_in.toPlainText().strip(),
+            goalAmount=amt * 1000, label=self.label_in.text().strip()
+        )
+
+        def work():
+            return g["id"], _goal_from_reply(self._post_ok(self.UPDATE_URL, pl))
+        self.run_in_background(work, self._on_goal_replaced, self._on_mutation_error)
 
     def delete_all_goals(self):
-        try:
-            params = {"chatRoomIds": self.CHAT_ID, "ngsw-bypass": "true"}
-            r = requests.get(self.BASE_URL, params=params, headers=self.HEADERS)
-            r.raise_for_status()
-            items = r.json().get("response", [])
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        # Every mutation either re-fetches or patches the cached list, so it is current
+        items = list(self.all_goals)
+
+        def work():
+            deleted_at = _now_ms()  # one timestamp for the whole batch
+            submit, post, url, payload = self.io_pool.submit, self._post, self.UPDATE_URL, self._goal_payload
+            # Deletes are independent, so fire them concurrently over the pooled session
+            futures = [submit(post, url, payload(g, status=1, deletedAt=deleted_at)) for g in items]
+            failures = (_request_failure(f) for f in as_completed(futures))
+            return [x for x in failures if x is not None]
+        self.run_in_background(work, self._on_goals_deleted, self._on_mutation_error)
+
+    def _on_goals_deleted(self, failures):
+        if not failures:  # everything is gone, no need to ask the server
+            self._apply_patched_goals([])
             return
-        for g in items:
-            pl = {
-                "id": g["id"], "chatRoomId": self.CHAT_ID, "accountId": g["accountId"],
-                "currentAmount": g.get("currentAmount", 0), "deletedAt": int(time.time() * 1000),
-                "description": g.get("description", ""), "goalAmount": g["goalAmount"],
-                "label": g["label"], "status": 1, "type": g.get("type", 0), "version": g.get("version", 0)
-            }
-            requests.post(self.UPDATE_URL, json=pl, headers=self.HEADERS)
-        self.fetch_goals()
+        self._toast(f"Delete failed for {len(failures)} goal(s): "
+                    + ", ".join(str(x) for x in failures))
+        self.schedule_goals_refresh()
 
     def reset_goal(self):
         idx = self.radio_group.checkedId()
@@ -627,25 +992,85 @@ class GoalManager(QWidget):
             QMessageBox.warning(self, "No selection", "Select a goal first")
             return
         g = self.goals[idx]
-        pl_del = {
-            "id": g["id"], "chatRoomId": self.CHAT_ID, "accountId": g["accountId"],
-            "currentAmount": g.get("currentAmount", 0), "deletedAt": int(time.time() * 1000),
-            "description": g.get("description", ""), "goalAmount": g["goalAmount"],
-            "label": g["label"], "status": 1, "type": g.get("type", 0), "version": g.get("version", 0)
-        }
-        r1 = requests.post(self.UPDATE_URL, json=pl_del, headers=self.HEADERS)
-        if r1.status_code // 100 != 2:
-            QMessageBox.critical(self, "Error", f"Reset delete failed: {r1.status_code}")
-            return
-        pl_new = {
-            "chatRoomId": self.CHAT_ID, "type": 0, "goalAmount": g["goalAmount"],
+        pl_zero = self._goal_payload(g, currentAmount=0)
+        pl_new = self._base_payload | {
+            "type": 0, "goalAmount": g["goalAmount"],
             "label": g["label"], "description": g["description"]
         }
-        r2 = requests.post(self.CREATE_URL, json=pl_new, headers=self.HEADERS)
-        if r2.status_code // 100 == 2:
-            self.fetch_goals()
+
+        def work():
+            # Zeroing the goal in place is one request and keeps its id
+            current = g
+            r = self._post(self.UPDATE_URL, pl_zero)
+            if r.status_code // 100 == 2:
+                updated = _goal_from_reply(r)
+                if updated is not False and updated.get("currentAmount") == 0:
+                    return g["id"], updated
+                # Accepted without zeroing the amount (the server may own currentAmount).
+                # The update may have bumped the version, so delete the goal as it
+                # stands now rather than the copy from before the click
+                current = g | updated if updated is not False else self._fetch_goal(g["id"])
+            # Replace the goal instead: delete, and only create once the delete went
+            # through, so a rejected delete can't leave a duplicate behind
+            pl_del = self._goal_payload(current, status=1, deletedAt=_now_ms())
+            self._post_ok(self.UPDATE_URL, pl_del, "Reset delete failed: ")
+            return g["id"], _goal_from_reply(self._post_ok(self.CREATE_URL, pl_new, "Reset create failed: "))
+        self.run_in_background(work, self._on_goal_replaced, self._on_mutation_error)
+
+    def _fetch_goal(self, goal_id):
+        """Fetches the server's current copy of one goal (blocking; worker thread only)."""
+        r = self._get(self.BASE_URL, params={"chatRoomIds": self.CHAT_ID, "ngsw-bypass": "true"})
+        r.raise_for_status()
+        for goal in _parse_json(r).get("response") or []:
+            if goal.get("id") == goal_id:
+                return goal
+        raise RuntimeError("Reset failed: the goal no longer exists")
+
+    def _on_goal_replaced(self, result):
+        """
+        Patches the cached goal list after a mutation instead of re-fetching it:
+        new_goal replaces goal old_id, None removes it, False (no usable goal in
+        the reply) falls back to a refresh.
+        """
+        old_id, new_goal = result
+        if new_goal is False:
+            self.schedule_goals_refresh()
+            return
+        if new_goal is None:
+            self._apply_patched_goals([x for x in self.all_goals if x.get("id") != old_id])
+            return
+        items = [new_goal if x.get("id") == old_id else x for x in self.all_goals]
+        # A re-created goal has a new id; keep it selected like the one it replaced
+        self._apply_patched_goals(items, renamed={old_id: new_goal.get("id")})
+
+    def _apply_patched_goals(self, items, renamed=None):
+        # The ETag, body hash and fetch time describe the last server response, not
+        # this local guess; drop them so the next fetch can't skip a wrong patch
+        self.goals_etag = None
+        self.goals_hash = None
+        self._goals_fetched_at = 0.0
+        self._apply_goals(items, renamed=renamed)
+
+    def _on_mutation_error(self, message):
+        # A failed (or half-done) mutation leaves the local list unknown, so re-fetch it
+        self._toast(f"Error: {message}")
+        self.schedule_goals_refresh()
+
+    def closeEvent(self, event):
+        self._flush_config()
+        self.io_pool.shutdown(wait=False)
+        self.session.close()
+        super().closeEvent(event)
+
+    def _dispatch_preset(self, button_id):
+        group, rest = divmod(button_id, 100)
+        action, slot = divmod(rest, 10)
+        if action == PRESET_SAVE:
+            self.save_preset(group, slot)
+        elif action == PRESET_EDIT:
+            self.edit_preset(group, slot)
         else:
-            QMessageBox.critical(self, "Error", f"Reset create failed: {r2.status_code}")
+            self.send_presets(group)
 
     def save_preset(self, group, slot):
         """
@@ -665,9 +1090,23 @@ class GoalManager(QWidget):
             "label": self.label_in.text().strip(),
             "description": self.desc_in.toPlainText().strip()
         }
-        save_config(self.AUTH_TOKEN, self.CHAT_ID, self.PRESETS)
+        self.schedule_config_save()
         QMessageBox.information(self, "Saved", f"Group {group} Slot {slot}")
 
+    def schedule_config_save(self):
+        """
+        Marks the in-memory config dirty and writes it out shortly after, so
+        several preset saves in a row coalesce into a single disk write.
+        """
+        self._config_dirty = True
+        QTimer.singleShot(500, self._flush_config)
+
+    def _flush_config(self):
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        save_config(self.AUTH_TOKEN, self.CHAT_ID, self.PRESETS)
+
     def edit_preset(self, group, slot):
         gk = str(group)
         sk = str(slot)
@@ -685,19 +1124,114 @@ class GoalManager(QWidget):
         if not presets:
             QMessageBox.warning(self, "Missing", f"No presets found for Group {group}")
             return
-        failed = []
-        for sk, pl in presets.items():
-            r = requests.post(self.CREATE_URL, json=pl, headers=self.HEADERS)
-            if r.status_code // 100 != 2:
-                failed.append((sk, r.status_code))
+        items = list(presets.items())
+
+        def work():
+            submit, post, url = self.io_pool.submit, self._post, self.CREATE_URL
+            futures = {submit(post, url, pl): sk for sk, pl in items}
+            failures = ((futures[f], _request_failure(f)) for f in as_completed(futures))
+            return sorted((sk, x) for sk, x in failures if x is not None)
+        self.run_in_background(work, self._on_presets_sent)
+
+    def _on_presets_sent(self, failed):
         if failed:
-            QMessageBox.warning(self, "Some Failed", "\n".join(f"Slot {s}: {code}" for s, code in failed))
-        self.fetch_goals()
+            self._toast(f"Send failed for {len(failed)} preset(s): "
+                        + ", ".join(f"slot {s} ({x})" for s, x in failed))
+        self.schedule_goals_refresh()
 
+    def check_for_update(self):
+        self.run_in_background(fetch_latest_version, self._on_latest_version, self._on_update_check_failed)
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
+    def _on_latest_version(self, result):
+        latest, etag = result
+        if etag and (etag, latest) != (_config.get("VERSION_ETAG"), _config.get("VERSION_LATEST")):
+            update_config(VERSION_ETAG=etag, VERSION_LATEST=latest)
+        if latest != PROGRAM_VERSION:
+            show_update_dialog(latest, self)
+
+    def _on_update_check_failed(self, message):
+        print(f"[WARN] Version check failed: {message}")
+
+    # ---------------------- Background request plumbing ----------------------
+    def run_in_background(self, fn, on_done, on_error=None):
+        """
+        Runs fn off the GUI thread; on_done receives its return value and
+        on_error the error message, both back on the GUI thread.
+        """
+        worker = ApiWorker(fn)
+        worker.signals.finished.connect(on_done)
+        worker.signals.error.connect(on_error or self._on_api_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _get(self, url, params=None, headers=None):
+        if httpx:  # httpx doesn't follow redirects by default and has the timeout built in
+            return self.session.get(url, params=params, headers=headers)
+        return self.session.get(url, params=params, headers=headers,
+                                allow_redirects=False, timeout=API_TIMEOUT)
+
+    def _post(self, url, pl):
+        if httpx:
+            return self.session.post(url, content=json_dumps(pl))
+        return self.session.post(url, data=json_dumps(pl), allow_redirects=False, timeout=API_TIMEOUT)
+
+    def _post_ok(self, url, pl, error_prefix=""):
+        """
+        POSTs pl from a worker thread; raises on non-2xx so the error is
+        reported through the worker's error signal.
+        """
+        r = self._post(url, pl)
+        if r.status_code // 100 != 2:
+            raise RuntimeError(f"{error_prefix}{r.status_code}")
+        return r
+
+    def _goal_payload(self, g, **overrides):
+        """
+        Builds a goal/update payload from a fetched goal, with any overrides
+        (status, deletedAt, edited fields, ...) applied on top.
+        """
+        return self._base_payload | {
+            "id": g["id"], "accountId": g["accountId"],
+            "currentAmount": g.get("currentAmount", 0), "deletedAt": g.get("deletedAt", 0),
+            "description": g.get("description", ""), "goalAmount": g["goalAmount"],
+            "label": g["label"], "status": g.get("status", 0), "type": g.get("type", 0),
+            "version": g.get("version", 0)
+        } | overrides
+
+    def _on_goals_changed(self, _result=None):
+        self.schedule_goals_refresh()
+
+    def schedule_goals_refresh(self):
+        """
+        Refreshes the goal list shortly after a mutation; mutations finishing
+        within the same 150 ms window share one GET instead of one each.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(150, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        self._refresh_pending = False
+        self.fetch_goals(force=True)
+
+    def _on_api_error(self, message):
+        self._toast(f"Error: {message}")
+
+    def _toast(self, text, ms=3000):
+        """
+        Shows text in the footer status line for ms milliseconds. Used instead
+        of modal dialogs for request failures so nothing blocks the next click.
+        """
+        self.status_lbl.setText(text)
+        self._toast_timer.start(ms)
+    # ----------------------------------------------------------------------
+
+
+@lru_cache(maxsize=1)
+def build_dark_palette():
+    """
+    Builds the app-wide dark palette once; needs a QApplication to exist.
+    """
     dark = QPalette()
     dark.setColor(QPalette.Window, QColor(30, 30, 30))
     dark.setColor(QPalette.WindowText, Qt.white)
@@ -712,8 +1246,13 @@ if __name__ == "__main__":
     dark.setColor(QPalette.Link, QColor(42, 130, 218))
     dark.setColor(QPalette.Highlight, QColor(42, 130, 218))
     dark.setColor(QPalette.HighlightedText, Qt.black)
-    app.setPalette(dark)
-    check_for_update()
+    return dark
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    app.setPalette(build_dark_palette())
     w = GoalManager()
     w.show()
     sys.exit(app.exec())